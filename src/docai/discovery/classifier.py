@@ -12,6 +12,9 @@ _D = FileClassification.documentation
 _A = FileClassification.asset
 _I = FileClassification.ignored
 
+# Trailing interpreter version, e.g. "python3.11" → "python".
+_VERSION_SUFFIX_RE = re.compile(r"\d+(\.\d+)*$")
+
 # ── Step 1: supplemental magic byte table ─────────────────────────────────────
 # Used only for formats the `filetype` library does not cover.
 # Each entry is (signature, offset, secondary_signature, secondary_offset).
@@ -298,7 +301,7 @@ def classify(path: Path) -> tuple[str | None, FileClassification]:
         interpreter = _parse_shebang(data)
         if interpreter in SHEBANG_MAP:
             return SHEBANG_MAP[interpreter]
-        normalized = re.sub(r"\d+(\.\d+)*$", "", interpreter)
+        normalized = _VERSION_SUFFIX_RE.sub("", interpreter)
         if normalized and normalized in SHEBANG_MAP:
             return SHEBANG_MAP[normalized]
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import hashlib
 import logging
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 from docai.discovery.classifier import classify
 from docai.discovery.datatypes import (
@@ -21,6 +23,37 @@ from docai.discovery.ignore_rules import IgnoreRules
 logger = logging.getLogger(__name__)
 
 
+class _FileScan(NamedTuple):
+    language: str | None
+    classification: FileClassification | None  # None: the file could not be read
+    content_hash: str | None
+    hash_failed: bool
+
+
+def _scan_file(path: Path, override: FileOverride | None) -> _FileScan:
+    # Runs on a worker thread: only file I/O and hashing, no logging or shared state.
+    try:
+        language, classification = classify(path)
+    except OSError:
+        return _FileScan(None, None, None, False)
+
+    # change here: excluded processed files also need no hashing
+    need_hash = (
+        classification == FileClassification.processed
+        and override != FileOverride.exclude
+    ) or (
+        override == FileOverride.include
+        and classification != FileClassification.asset
+    )
+    if not need_hash:
+        return _FileScan(language, classification, None, False)
+    try:
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return _FileScan(language, classification, None, True)
+    return _FileScan(language, classification, content_hash, False)
+
+
 class Walker:
     def __init__(
         self,
@@ -84,96 +117,106 @@ class Walker:
         traversal_order: list[str] = []
 
         queue: deque[Path] = deque([self.root])
-        while queue:
-            current = queue.popleft()
-            rel = current.relative_to(self.root)
-            rel_posix = rel.as_posix()
-
-            traversal_order.append(rel_posix)
-            dir_processed_files[rel_posix] = []
-            dir_non_asset_files[rel_posix] = []
-            dir_asset_files[rel_posix] = []
-            dir_children[rel_posix] = []
-
-            try:
-                entries = sorted(current.iterdir())
-            except PermissionError:
-                raise DiscoveryError(
-                    message=f"Permission denied reading directory: '{rel_posix}'",
-                    code="DISCOVERY_PERMISSION_DENIED",
-                )
+        with ThreadPoolExecutor() as executor:
+            while queue:
+                current = queue.popleft()
+                rel = current.relative_to(self.root)
+                rel_posix = rel.as_posix()
 
-            for entry in entries:
-                if (  # change here: include force included symlinks
-                    entry.is_symlink()
-                    and self.ignore_rules.file_override(entry.relative_to(self.root))
-                    != FileOverride.include
-                ):
-                    rel_entry_posix = entry.relative_to(self.root).as_posix()
-                    logger.warning("[Discovery] Symlink ignored: '%s'", rel_entry_posix)
-                    continue
-
-                if entry.is_dir():
-                    rel_entry_path = entry.relative_to(self.root)
-                    if self.ignore_rules.should_prune_directory(rel_entry_path):
-                        pruned.add(rel_entry_path.as_posix())
-                    else:
-                        dir_children[rel_posix].append(rel_entry_path.as_posix())
-                        queue.append(entry)
-                    continue
-
-                rel_entry_path = entry.relative_to(self.root)
-                rel_entry_posix = rel_entry_path.as_posix()
-                override = self.ignore_rules.file_override(rel_entry_path)
+                traversal_order.append(rel_posix)
+                processed_files: list[str] = []
+                non_asset_files: list[str] = []
+                asset_files: list[Path] = []
+                children: list[str] = []
+                dir_processed_files[rel_posix] = processed_files
+                dir_non_asset_files[rel_posix] = non_asset_files
+                dir_asset_files[rel_posix] = asset_files
+                dir_children[rel_posix] = children
 
                 try:
-                    language, classification = classify(entry)
-                except OSError:
-                    logger.warning(
-                        "[Discovery] Could not read file, skipping: '%s'",
-                        rel_entry_posix,
+                    entries = sorted(current.iterdir())
+                except PermissionError:
+                    raise DiscoveryError(
+                        message=f"Permission denied reading directory: '{rel_posix}'",
+                        code="DISCOVERY_PERMISSION_DENIED",
                     )
-                    continue
 
-                if classification == FileClassification.unknown:
-                    logger.warning(
-                        "[Discovery] Unknown file type, skipping processing: '%s'",
-                        rel_entry_posix,
+                # Symlink/directory checks are cheap stats; file reads are deferred
+                # to the pool below so header reads and hashing overlap on disk.
+                # An ignored symlink is queued with entry None so its warning is
+                # logged in sequence with the scan results.
+                file_entries: list[tuple[Path | None, str, FileOverride | None]] = []
+                for entry in entries:
+                    # Computed once per entry and reused by every branch below.
+                    rel_entry_path = entry.relative_to(self.root)
+                    rel_entry_posix = rel_entry_path.as_posix()
+
+                    if (  # change here: include force included symlinks
+                        entry.is_symlink()
+                        and self.ignore_rules.file_override(rel_entry_path)
+                        != FileOverride.include
+                    ):
+                        file_entries.append((None, rel_entry_posix, None))
+                        continue
+
+                    if entry.is_dir():
+                        if self.ignore_rules.should_prune_directory(rel_entry_path):
+                            pruned.add(rel_entry_posix)
+                        else:
+                            children.append(rel_entry_posix)
+                            queue.append(entry)
+                        continue
+
+                    file_entries.append(
+                        (entry, rel_entry_posix, self.ignore_rules.file_override(rel_entry_path))
                     )
 
-                # change here: excluded processed files also need no hashing
-                need_hash = (
-                    classification == FileClassification.processed
-                    and override != FileOverride.exclude
-                ) or (
-                    override == FileOverride.include
-                    and classification != FileClassification.asset
+                # map() yields in submission order, so the manifest and the
+                # warnings below come out in the same order as a serial walk.
+                scans = executor.map(
+                    _scan_file,
+                    [entry for entry, _, _ in file_entries if entry is not None],
+                    [override for entry, _, override in file_entries if entry is not None],
                 )
-                content_hash: str | None = None
-                if need_hash:
-                    try:
-                        data = entry.read_bytes()
-                        content_hash = hashlib.sha256(data).hexdigest()
-                    except OSError:
+                for entry, rel_entry_posix, override in file_entries:
+                    if entry is None:
+                        logger.warning("[Discovery] Symlink ignored: '%s'", rel_entry_posix)
+                        continue
+
+                    scan = next(scans)
+                    if scan.classification is None:
+                        logger.warning(
+                            "[Discovery] Could not read file, skipping: '%s'",
+                            rel_entry_posix,
+                        )
+                        continue
+
+                    if scan.classification == FileClassification.unknown:
+                        logger.warning(
+                            "[Discovery] Unknown file type, skipping processing: '%s'",
+                            rel_entry_posix,
+                        )
+
+                    if scan.hash_failed:
                         logger.warning(
                             "[Discovery] Could not read file for hashing, skipping: '%s'",
                             rel_entry_posix,
                         )
                         continue
 
-                file_manifest[rel_entry_posix] = ManifestEntry(
-                    classification=classification,
-                    language=language,
-                    content_hash=content_hash,
-                    override=override,
-                )
+                    file_manifest[rel_entry_posix] = ManifestEntry(
+                        classification=scan.classification,
+                        language=scan.language,
+                        content_hash=scan.content_hash,
+                        override=override,
+                    )
 
-                if classification == FileClassification.asset:
-                    dir_asset_files[rel_posix].append(entry)
-                else:
-                    dir_non_asset_files[rel_posix].append(rel_entry_posix)
-                    if classification == FileClassification.processed:
-                        dir_processed_files[rel_posix].append(rel_entry_posix)
+                    if scan.classification == FileClassification.asset:
+                        asset_files.append(entry)
+                    else:
+                        non_asset_files.append(rel_entry_posix)
+                        if scan.classification == FileClassification.processed:
+                            processed_files.append(rel_entry_posix)
 
         # Bottom-up package qualification (reverse BFS = leaves first).
         package_manifest: PackageManifest = {}
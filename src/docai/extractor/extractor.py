@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from docai.discovery.datatypes import FileManifest, ManifestEntry
 from docai.errors import DocaiError
 from docai.extractor.datatypes import FileAnalysis
 from docai.extractor.errors import ExtractionError
 from docai.extractor.llm_fallback import extract_with_llm
-from docai.llm.service import LLMService
 from docai.state.analyses import get_analysis, save_analysis
 
+if TYPE_CHECKING:
+    from docai.llm.service import LLMService
+
 
 async def extract(
     file_path: str,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from pydantic import BaseModel
 
@@ -9,8 +10,10 @@ from docai.discovery.datatypes import FileManifest, ManifestEntry
 from docai.extractor.datatypes import Entity, EntityCategory, FileAnalysis, FileType
 from docai.extractor.errors import ExtractionError
 from docai.llm.errors import LLMError
-from docai.llm.service import LLMService
-from docai.prompts.loader import load_prompt
+from docai.prompts.loader import PromptTemplate, load_prompt
+
+if TYPE_CHECKING:
+    from docai.llm.service import LLMService
 
 # --- Structured output models ---
 
@@ -69,12 +72,10 @@ def _merge_entities(*entity_lists: EntityList) -> EntityList:
 def _make_type_and_deps_validator(
     file_manifest: FileManifest,
 ) -> Callable[[str | BaseModel], str | None]:
-    all_files = set(file_manifest)
-
     def validate(result: str | BaseModel) -> str | None:
         if not isinstance(result, FileTypeAndDeps):
             return "Expected a FileTypeAndDeps object"
-        invalid = [d for d in result.dependencies if d not in all_files]
+        invalid = [d for d in result.dependencies if d not in file_manifest]
         if invalid:
             return (
                 f"The following paths are not in the project file list: "
@@ -126,9 +127,9 @@ async def _extract_entities(
     content: str,
     manifest_entry: ManifestEntry,
     llm_service: LLMService,
+    template: PromptTemplate,
 ) -> EntityList:
     lang = manifest_entry.language or "unknown"
-    template = load_prompt("extractor/entities", language=lang)
     prompt = template.user_prompt_template.format_map({
         "file_path": file_path,
         "language": lang,
@@ -166,13 +167,16 @@ async def _extract_entities_chunked(
             len(chunks),
         )
 
-    results: list[EntityList] = []
-    for i, chunk_content in enumerate(chunks):
+    # Resolved once per file rather than once per chunk.
+    template = load_prompt(
+        "extractor/entities", language=manifest_entry.language or "unknown"
+    )
+
+    async def extract_chunk(i: int, chunk_content: str) -> EntityList | None:
         try:
-            entity_list = await _extract_entities(
-                file_path, chunk_content, manifest_entry, llm_service
+            return await _extract_entities(
+                file_path, chunk_content, manifest_entry, llm_service, template
             )
-            results.append(entity_list)
         except LLMError:
             logger.warning(
                 "Entity extraction failed for chunk %d/%d of '%s' — skipping",
@@ -180,6 +184,25 @@ async def _extract_entities_chunked(
                 len(chunks),
                 file_path,
             )
+            return None
+
+    # Chunks are independent requests; run them concurrently and let the
+    # LLMService admission limits bound how many are in flight. The TaskGroup
+    # cancels the remaining chunks if one fails with anything but LLMError.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(extract_chunk(i, chunk))
+                for i, chunk in enumerate(chunks)
+            ]
+    except BaseExceptionGroup as group:
+        # Surface the failure itself, as the serial loop did, not the group.
+        first, *others = group.exceptions
+        for exc in others:
+            logger.warning("Another chunk of '%s' also failed: %r", file_path, exc)
+        raise first from None
+    outcomes = [task.result() for task in tasks]
+    results = [entity_list for entity_list in outcomes if entity_list is not None]
 
     return _merge_entities(*results) if results else EntityList(entities=[])
 
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import TracebackType
+
+from docai.llm.errors import LLMError
+
+
+def _check_limit(limit: int) -> None:
+    if limit < 1:
+        raise LLMError(
+            code="LLM_INVALID_CONCURRENCY",
+            message=f"Concurrency limit must be >= 1, got {limit}",
+        )
+
+
+class AdmissionController:
+    """Counting admission gate whose limit can be changed while in use.
+
+    Behaves like ``asyncio.Semaphore`` for ``async with`` use, but the
+    counter and limit are explicit, so resizing is a supported operation
+    rather than a mutation of semaphore internals. Lowering the limit never
+    revokes slots that are already held; new callers simply wait until the
+    number in flight drops below the new limit.
+    """
+
+    def __init__(self, limit: int) -> None:
+        _check_limit(limit)
+        self._limit = limit
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def available(self) -> int:
+        return max(self._limit - self._in_flight, 0)
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        _check_limit(limit)
+        async with self._cond:
+            raised = limit > self._limit
+            self._limit = limit
+            if raised:
+                self._cond.notify_all()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.release()
+
+
+class TokenBucket:
+    """Async token bucket limiting how fast requests may start.
+
+    Composes with AdmissionController rather than replacing it: admission
+    bounds how many calls are in flight, the bucket bounds how much is sent
+    per unit of time, so a freed slot cannot trigger a burst past a provider
+    quota. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        if rate <= 0 or burst <= 0:
+            raise LLMError(
+                code="LLM_INVALID_RATE_LIMIT",
+                message=f"Rate and burst must be > 0, got rate={rate}, burst={burst}",
+            )
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        return self._burst
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, cost: float = 1) -> None:
+        # A request larger than the bucket could never be admitted; cap it so
+        # it waits for a full bucket instead of forever.
+        cost = min(cost, self._burst)
+        async with self._lock:
+            self._refill()
+            while self._tokens < cost:
+                await asyncio.sleep((cost - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= cost
@@ -17,6 +17,12 @@ def _ge1_int(v: int) -> int:
     return v
 
 
+def _ge0_int(v: int) -> int:
+    if v < 0:
+        raise ValueError("must be >= 0")
+    return v
+
+
 def _ge0_float(v: float) -> float:
     if v < 0:
         raise ValueError("must be >= 0")
@@ -53,6 +59,19 @@ def _penalty_opt(v: float | None) -> float | None:
     return v
 
 
+_OPTIONAL_LITELLM_PARAMS: tuple[str, ...] = (
+    "num_retries",
+    "timeout",
+    "temperature",
+    "top_p",
+    "n",
+    "max_completion_tokens",
+    "max_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+)
+
+
 class ModelConfig(BaseModel):
     # LiteLLM-passable fields
     model: str
@@ -72,13 +91,23 @@ class ModelConfig(BaseModel):
     # DocAI-internal fields
     validation_retries: Annotated[int, AfterValidator(_ge1_int)] = 3
     max_concurrency: Annotated[int, AfterValidator(_ge1_int)] = 5
+    # Retries of transient provider errors (429/5xx/timeouts) on the same model
+    # before falling back to the next one; 0 falls back immediately.
+    transient_retries: Annotated[int, AfterValidator(_ge0_int)] = 0
+    retry_base_delay: Annotated[float, AfterValidator(_ge0_float)] = 1.0
+    retry_max_delay: Annotated[float, AfterValidator(_ge0_float)] = 30.0
+    # Provider quotas enforced client-side with token buckets; None disables.
+    # Token usage is estimated from prompt length before the call is sent.
+    requests_per_minute: Annotated[int | None, AfterValidator(_ge1_int_opt)] = None
+    tokens_per_minute: Annotated[int | None, AfterValidator(_ge1_int_opt)] = None
 
     def to_litellm_kwargs(self) -> dict[str, Any]:
         """Return kwargs suitable for passing directly to LiteLLM's acompletion.
 
         Explicit fields take precedence over same-named keys in extra_kwargs.
         None-valued fields are omitted so LiteLLM/provider defaults apply.
-        validation_retries and max_concurrency are never included.
+        DocAI-internal fields (validation_retries, max_concurrency, the
+        transient retry settings and rate limits) are never included.
         """
         result: dict[str, Any] = dict(self.extra_kwargs)
 
@@ -105,18 +134,7 @@ class ModelConfig(BaseModel):
 
     def configured_params(self) -> set[str]:
         """Return the set of optional LiteLLM param names that are explicitly set (non-None)."""
-        fields = [
-            "num_retries",
-            "timeout",
-            "temperature",
-            "top_p",
-            "n",
-            "max_completion_tokens",
-            "max_tokens",
-            "presence_penalty",
-            "frequency_penalty",
-        ]
-        return {f for f in fields if getattr(self, f) is not None}
+        return {f for f in _OPTIONAL_LITELLM_PARAMS if getattr(self, f) is not None}
 
 
 class LLMProfile(BaseModel):
@@ -138,7 +156,7 @@ class LogConfig(BaseModel):
 
 
 class LLMCallAttempt(BaseModel):
-    model_args: dict  # _connections[i][0] with api_key masked as "[REDACTED]"
+    model_args: dict  # _Connection.log_model_args — api_key masked as "[REDACTED]"
     latency_ms: float
     usage_metadata: (
         dict | None
@@ -170,7 +188,7 @@ class LLMGenerateLog(BaseModel):
     error_code: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelStats:
     model: str = ""
     total_calls: int = 0
@@ -186,7 +204,7 @@ class ModelStats:
     errors: set[str] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMStats:
     total_calls: int = 0
     successful_calls: int = 0
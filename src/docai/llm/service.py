@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
+import random
 import time
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from logging import getLogger
 from pathlib import Path
-from typing import Callable
+from typing import Callable, NamedTuple
 
 import litellm
 from litellm import openai
 from pydantic import BaseModel
 
+from docai.llm.admission import AdmissionController, TokenBucket
 from docai.llm.datatypes import (
     LLMCallAttempt,
     LLMGenerateLog,
@@ -30,47 +34,172 @@ logger = getLogger(__name__)
 
 LOG_FILE_NAME = "llm.log"
 
+# Provider errors worth retrying on the same model: timeouts, rate limits and
+# 5xx responses. Anything else moves straight to the next connection.
+_TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# (model, sha256 of api key) pairs that already passed check_valid_key in this
+# process. check_valid_key makes a real completion request, so services built
+# from the same profile don't repeat it. Keys are never stored in plaintext.
+_VALIDATED_KEYS: set[tuple[str, str]] = set()
+
+# num_retries and timeout are litellm-internal — not provider API params,
+# so they won't appear in get_supported_openai_params() for any model.
+_LITELLM_INTERNAL_PARAMS = frozenset({"num_retries", "timeout"})
+
 _CAPABILITY_NAMES: dict[str, str] = {
     "response_format": "structured output",
     "tools": "function calling",
 }
 
 
+class _Connection(NamedTuple):
+    model_args: dict
+    validation_retries: int
+    admission: AdmissionController
+    max_concurrency: int  # the model's configured limit, before profile capping
+    # model_args with the api key redacted, built once for log entries
+    log_model_args: dict
+    transient_retries: int
+    retry_base_delay: float
+    retry_max_delay: float
+    request_bucket: TokenBucket | None
+    token_bucket: TokenBucket | None
+
+
+def _per_minute_bucket(limit: int | None) -> TokenBucket | None:
+    # Refill continuously at limit/60 per second; a full minute's quota may burst.
+    if limit is None:
+        return None
+    return TokenBucket(rate=limit / 60, burst=limit)
+
+
+def _estimate_tokens(messages: list[dict | litellm.Message]) -> int:
+    # Rough len/4 heuristic; only used to pace calls against tokens_per_minute.
+    chars = 0
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else message.content
+        if isinstance(content, str):
+            chars += len(content)
+    return max(chars // 4, 1)
+
+
+_REDACTED = "[REDACTED]"
+
+
+def _redact(model_args: dict) -> dict:
+    if "api_key" not in model_args:
+        return dict(model_args)
+    return {**model_args, "api_key": _REDACTED}
+
+
+def _is_transient(error: Exception) -> bool:
+    return getattr(error, "status_code", None) in _TRANSIENT_STATUS_CODES
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds the provider asked us to wait via a Retry-After header, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(
+        error, "headers", None
+    )
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _backoff_delay(error: Exception, attempt: int, base: float, cap: float) -> float:
+    # A provider-supplied Retry-After wins over the computed delay. Otherwise use
+    # exponential backoff with jitter, so concurrent callers hitting the same
+    # rate limit don't retry in lockstep.
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(cap, retry_after)
+    return min(cap, base * 2**attempt * random.uniform(0.5, 1.5))
+
+
+async def aclose_llm_clients() -> None:
+    """Close litellm's cached provider HTTP clients.
+
+    litellm keeps one client per provider for the whole process, shared by every
+    LLMService, so the top-level program calls this once at shutdown. The cache
+    is flushed as well, so later calls build fresh clients instead of reusing
+    closed ones.
+    """
+    await litellm.close_litellm_async_clients()
+    litellm.in_memory_llm_clients_cache.flush_cache()
+
+
 class LLMService:
     def __init__(self, profile: LLMProfile, log_config: LogConfig) -> None:
         self._log_file = self._setup_log_dir(log_config)
-        self._global_semaphore = asyncio.Semaphore(profile.max_concurrency)
-        self._connections: list[tuple[dict, int, asyncio.Semaphore]] = []
+        self._global_admission = AdmissionController(profile.max_concurrency)
+        self._connections: list[_Connection] = []
 
         for model in profile.models:
             self._validate_model(model, profile)
             effective = min(model.max_concurrency, profile.max_concurrency)
             if model.max_concurrency > profile.max_concurrency:
                 logger.debug(
-                    f"Model '{model.model}': max_concurrency {model.max_concurrency} "
-                    f"exceeds profile limit {profile.max_concurrency}, "
-                    f"capping to {profile.max_concurrency}"
+                    "Model '%s': max_concurrency %d exceeds profile limit %d, capping to %d",
+                    model.model,
+                    model.max_concurrency,
+                    profile.max_concurrency,
+                    profile.max_concurrency,
                 )
+            model_args = model.to_litellm_kwargs()
             self._connections.append(
-                (
-                    model.to_litellm_kwargs(),
-                    model.validation_retries,
-                    asyncio.Semaphore(effective),
+                _Connection(
+                    model_args=model_args,
+                    validation_retries=model.validation_retries,
+                    admission=AdmissionController(effective),
+                    max_concurrency=model.max_concurrency,
+                    log_model_args=_redact(model_args),
+                    transient_retries=model.transient_retries,
+                    retry_base_delay=model.retry_base_delay,
+                    retry_max_delay=model.retry_max_delay,
+                    request_bucket=_per_minute_bucket(model.requests_per_minute),
+                    token_bucket=_per_minute_bucket(model.tokens_per_minute),
                 )
             )
 
+    async def set_max_concurrency(self, max_concurrency: int) -> None:
+        """Change the profile-wide concurrency limit without rebuilding the service.
+
+        Per-model limits are re-capped against the new value the same way as at
+        construction. Calls already in flight keep their slots.
+        """
+        await self._global_admission.set_limit(max_concurrency)
+        for conn in self._connections:
+            await conn.admission.set_limit(min(conn.max_concurrency, max_concurrency))
+
     def _validate_model(self, model: ModelConfig, profile: LLMProfile) -> None:
         # API key validation (only when key is in config and no custom base_url)
         if not profile.skip_api_key_validation and model.api_key and not model.base_url:
-            try:
-                valid = litellm.check_valid_key(model.model, model.api_key)
-            except Exception:
-                valid = False
-            if not valid:
-                raise LLMError(
-                    code="LLM_AUTH_FAILED",
-                    message=f"API key validation failed for model '{model.model}'",
-                )
+            key_id = (model.model, hashlib.sha256(model.api_key.encode()).hexdigest())
+            if key_id not in _VALIDATED_KEYS:
+                try:
+                    valid = litellm.check_valid_key(model.model, model.api_key)
+                except Exception:
+                    valid = False
+                if not valid:
+                    raise LLMError(
+                        code="LLM_AUTH_FAILED",
+                        message=f"API key validation failed for model '{model.model}'",
+                    )
+                _VALIDATED_KEYS.add(key_id)
 
         # Capability and parameter checks
         supported = set(
@@ -86,23 +215,21 @@ class LLMService:
                     code="LLM_CAPABILITY_NOT_SUPPORTED",
                     message=f"Model '{model.model}' does not support {_CAPABILITY_NAMES[capability]}",
                 )
+        unsupported = model.configured_params() - _LITELLM_INTERNAL_PARAMS - supported
+        if unsupported:
+            param = min(unsupported)  # deterministic when several are unsupported
+            raise LLMError(
+                code="LLM_UNSUPPORTED_PARAMETER",
+                message=f"Model '{model.model}' does not support parameter '{param}'",
+            )
 
-        # num_retries and timeout are litellm-internal — not provider API params,
-        # so they won't appear in get_supported_openai_params() for any model.
-        _LITELLM_INTERNAL_PARAMS = {"num_retries", "timeout"}
-        for param in model.configured_params() - _LITELLM_INTERNAL_PARAMS:
-            if param not in supported:
-                raise LLMError(
-                    code="LLM_UNSUPPORTED_PARAMETER",
-                    message=f"Model '{model.model}' does not support parameter '{param}'",
-                )
-
-        if not litellm.supports_response_schema(
+        supports_schema = litellm.supports_response_schema(
             model=model.model, custom_llm_provider=model.base_url
-        ):
+        )
+        if not supports_schema:
             raise LLMError(
                 code="LLM_UNSUPPORTED_PARAMETER",
-                message=f"Model '{model.model}' does not support response schema [{litellm.supports_response_schema(model=model.model, custom_llm_provider=model.base_url)}]",
+                message=f"Model '{model.model}' does not support response schema [{supports_schema}]",
             )
 
     def _setup_log_dir(self, log_config: LogConfig) -> Path:
@@ -146,19 +273,27 @@ class LLMService:
             pass
         return log_file
 
+    @staticmethod
+    async def _throttle(conn: _Connection, messages: list[dict | litellm.Message]) -> None:
+        # Runs before _call so a caller waiting on a rate limit holds no admission slot.
+        if conn.request_bucket is not None:
+            await conn.request_bucket.acquire()
+        if conn.token_bucket is not None:
+            await conn.token_bucket.acquire(_estimate_tokens(messages))
+
     async def _call(
         self,
         model_args: dict,
         messages: list[dict | litellm.Message],
-        model_semaphore: asyncio.Semaphore,
+        model_admission: AdmissionController,
         *,
         structured_output: type[BaseModel] | None = None,
     ) -> tuple[litellm.Message | Exception, litellm.Usage | None]:
 
         call_args = model_args.copy()
         try:
-            async with self._global_semaphore:
-                async with model_semaphore:
+            async with self._global_admission:
+                async with model_admission:
                     if structured_output:
                         call_args["response_format"] = structured_output
                     call_args["messages"] = messages
@@ -183,9 +318,10 @@ class LLMService:
         validation_error: str | None = None,
         error: str | None = None,
     ) -> LLMCallAttempt:
-        model_args = model_args.copy()
-        if "api_key" in model_args:
-            model_args["api_key"] = "[REDACTED]"
+        # Callers pass the connection's pre-redacted log_model_args; only copy
+        # when handed a dict that still carries a plaintext key.
+        if model_args.get("api_key") not in (None, _REDACTED):
+            model_args = _redact(model_args)
         if usage is not None:
             try:
                 prompt_tokens_price, completion_tokens_price = litellm.cost_per_token(
@@ -240,10 +376,12 @@ class LLMService:
         structured_output: type[BaseModel] | None = None,
         validator: Callable[[str | BaseModel], str | None] | None = None,
     ) -> str | BaseModel:
-        messages: list[dict] = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        user_message = {"role": "user", "content": prompt}
+        messages: list[dict | litellm.Message] = (
+            [{"role": "system", "content": system_prompt}, user_message]
+            if system_prompt
+            else [user_message]
+        )
 
         log_attempts: list[LLMCallAttempt] = []
         generation_start = time.perf_counter()
@@ -252,29 +390,62 @@ class LLMService:
         error_code: str | None = None
 
         try:
-            for model_args, val_retries, model_semaphore in self._connections:
-                try_messages: list[dict | litellm.Message] = list(messages)
-
-                for _ in range(val_retries):
-                    call_start = time.perf_counter()
-                    resp_message, usage = await self._call(
-                        model_args,
-                        try_messages,
-                        model_semaphore,
-                        structured_output=structured_output,
-                    )
-                    call_latency = time.perf_counter() - call_start
+            for conn in self._connections:
+                model_args = conn.model_args
+                log_model_args = conn.log_model_args
+                # Retries extend the history by rebinding, never in place, so every
+                # connection can start from the same list without copying it.
+                try_messages = messages
+                transient_attempt = 0
+
+                for _ in range(conn.validation_retries):
+                    while True:
+                        await self._throttle(conn, try_messages)
+                        call_start = time.perf_counter()
+                        resp_message, usage = await self._call(
+                            model_args,
+                            try_messages,
+                            conn.admission,
+                            structured_output=structured_output,
+                        )
+                        call_latency = time.perf_counter() - call_start
+
+                        if not (
+                            isinstance(resp_message, Exception)
+                            and transient_attempt < conn.transient_retries
+                            and _is_transient(resp_message)
+                        ):
+                            break
+
+                        log_attempts.append(
+                            self._log_attempt(
+                                model_args=log_model_args,
+                                latency=call_latency,
+                                messages=try_messages,
+                                error=str(resp_message),
+                            )
+                        )
+                        delay = _backoff_delay(
+                            resp_message,
+                            transient_attempt,
+                            conn.retry_base_delay,
+                            conn.retry_max_delay,
+                        )
+                        transient_attempt += 1
+                        logger.info("LLM call error: %s, retrying in %.1fs", resp_message, delay)
+                        # Back off outside _call so no admission slot is held while waiting.
+                        await asyncio.sleep(delay)
 
                     if isinstance(resp_message, Exception):
                         log_attempts.append(
                             self._log_attempt(
-                                model_args=model_args,
+                                model_args=log_model_args,
                                 latency=call_latency,
                                 messages=try_messages,
                                 error=str(resp_message),
                             )
                         )
-                        logger.info(f"LLM call error: {resp_message}")
+                        logger.info("LLM call error: %s", resp_message)
                         break  # move to next connection
 
                     if resp_message.role != "assistant" or resp_message.content is None:
@@ -285,7 +456,7 @@ class LLMService:
                         )
                         log_attempts.append(
                             self._log_attempt(
-                                model_args=model_args,
+                                model_args=log_model_args,
                                 latency=call_latency,
                                 usage=usage,
                                 messages=try_messages,
@@ -293,7 +464,7 @@ class LLMService:
                                 error=detail,
                             )
                         )
-                        logger.info(f"LLM response error: {detail}")
+                        logger.info("LLM response error: %s", detail)
                         break  # move to next connection
 
                     resp_content = resp_message.content
@@ -306,7 +477,7 @@ class LLMService:
                         except Exception as e:
                             log_attempts.append(
                                 self._log_attempt(
-                                    model_args=model_args,
+                                    model_args=log_model_args,
                                     latency=call_latency,
                                     usage=usage,
                                     messages=try_messages,
@@ -327,7 +498,7 @@ class LLMService:
                     if validator and (val_error := validator(resp_content)):
                         log_attempts.append(
                             self._log_attempt(
-                                model_args=model_args,
+                                model_args=log_model_args,
                                 latency=call_latency,
                                 usage=usage,
                                 messages=try_messages,
@@ -345,7 +516,7 @@ class LLMService:
                     # Success
                     log_attempts.append(
                         self._log_attempt(
-                            model_args=model_args,
+                            model_args=log_model_args,
                             latency=call_latency,
                             usage=usage,
                             messages=try_messages,
@@ -356,9 +527,7 @@ class LLMService:
                     final_response = resp_message
                     return resp_content  # finally still runs before returning
 
-                logger.debug(
-                    f"Connection '{model_args.get('model')}' exhausted all retries"
-                )
+                logger.debug("Connection '%s' exhausted all retries", model_args.get("model"))
 
             # All connections exhausted
             error_code = "LLM_ALL_MODELS_FAILED"
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import yaml
 
@@ -12,8 +16,28 @@ PROMPTS_ROOT: Path = Path(__file__).parent / "templates"
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader parses several times faster; fall back to the pure-Python
+# SafeLoader when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+# ── parse cache ───────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    data = yaml.load(Path(path).read_bytes(), Loader=_YAML_LOADER)
+    # Cached values are shared between callers, so hand out a read-only view.
+    return MappingProxyType(data) if isinstance(data, dict) else data
+
+
+def _load_yaml(path: Path) -> Any:
+    # mtime and size are part of the key so edits on disk are picked up.
+    st = path.stat()
+    return _parse_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     system_prompt_template: str
     user_prompt_template: str
@@ -27,7 +51,7 @@ def load_prompt(area: str, language: str | None = None) -> PromptTemplate:
             code="PROMPT_NOT_FOUND",
         )
 
-    base_data = yaml.safe_load(base_path.read_text())
+    base_data = _load_yaml(base_path)
     base = PromptTemplate(
         system_prompt_template=base_data["system_prompt_template"],
         user_prompt_template=base_data["user_prompt_template"],
@@ -43,10 +67,10 @@ def load_prompt(area: str, language: str | None = None) -> PromptTemplate:
     matched: PromptTemplate | None = None
     for override_file in sorted(overrides_dir.glob("*.yaml")):
         try:
-            data = yaml.safe_load(override_file.read_text())
+            data = _load_yaml(override_file)
         except yaml.YAMLError:
             continue
-        if not isinstance(data, dict) or data.get("language") != language:
+        if not isinstance(data, Mapping) or data.get("language") != language:
             continue
         if matched is not None:
             logger.warning(
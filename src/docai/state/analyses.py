@@ -7,7 +7,7 @@ from docai.state.artifact_status import get_status
 from docai.state.datatypes import GenerationStatus
 from docai.state.errors import StateError
 
-_PURGE_STATUSES = {GenerationStatus.deprecated, GenerationStatus.remove}
+_PURGE_STATUSES = frozenset({GenerationStatus.deprecated, GenerationStatus.remove})
 
 
 def purge_analyses() -> None:
@@ -67,11 +67,12 @@ def save_analysis(analysis: FileAnalysis) -> None:
 def get_analysis(file_path: str) -> FileAnalysis | None:
     path = Path.cwd() / ".docai" / "analyses" / (file_path + ".json")
 
-    if not path.exists():
-        return None
-
+    # Read first and treat a missing file as "no analysis": one syscall on the
+    # common hit path instead of a separate exists() stat.
     try:
         raw = path.read_text()
+    except FileNotFoundError:
+        return None
     except PermissionError as exc:
         raise StateError(
             message=f"No read permission on state artifact: {path}",
@@ -4,10 +4,7 @@ import argparse
 import asyncio
 import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
-from docai.llm.datatypes import LLMProfile, LogConfig, ModelConfig
-from docai.llm.service import LLMService
 from tests.evals.framework.cases import load_cases
 from tests.evals.framework.reporter import print_results, save_results
 from tests.evals.framework.runner import PROJECT_ROOT, run
@@ -46,6 +43,10 @@ def _load_all_cases(area: str | None, ids: list[str] | None) -> list:
 
 
 async def _run(args: argparse.Namespace) -> int:
+    # Imported here so `--help` and argument errors don't pay for litellm.
+    from docai.llm.datatypes import LLMProfile, LogConfig, ModelConfig
+    from docai.llm.service import LLMService, aclose_llm_clients
+
     ids = [s.strip() for s in args.case.split(",")] if args.case else None
 
     cases = _load_all_cases(args.area, ids)
@@ -61,9 +62,11 @@ async def _run(args: argparse.Namespace) -> int:
     )
     log_config = LogConfig(log_dir=log_dir, clean_on_start=True)
     service = LLMService(profile=profile, log_config=log_config)
-
-    print(f"Running {len(cases)} cases with model={args.model}, concurrency={args.concurrency}\n")
-    results = await run(cases, service, concurrency=args.concurrency)
+    try:
+        print(f"Running {len(cases)} cases with model={args.model}, concurrency={args.concurrency}\n")
+        results = await run(cases, service, concurrency=args.concurrency)
+    finally:
+        await aclose_llm_clients()
 
     print_results(results)
 
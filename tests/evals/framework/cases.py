@@ -7,14 +7,17 @@ import yaml
 
 CASES_ROOT: Path = Path(__file__).parent.parent / "cases"
 
+# Same choice as docai.prompts.loader: libyaml's C loader when available.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CaseEntity:
     name: str
     category: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalCase:
     id: str
     fixture: str
@@ -60,18 +63,21 @@ def load_cases(
     if not area_dir.is_dir():
         return []
 
+    wanted = set(ids) if ids is not None else None
     cases: list[EvalCase] = []
     for yaml_file in sorted(area_dir.rglob("*.yaml")):
         rel_path = yaml_file.relative_to(area_dir)
+        # The id depends only on the path, so unrequested cases are never parsed.
+        if wanted is not None and _derive_id(rel_path) not in wanted:
+            continue
         try:
-            data = yaml.safe_load(yaml_file.read_text())
+            data = yaml.load(yaml_file.read_bytes(), Loader=_YAML_LOADER)
             if not isinstance(data, dict):
                 continue
             case = _parse_case(data, area, rel_path)
         except (yaml.YAMLError, KeyError, TypeError):
             continue
-        if ids is None or case.id in ids:
-            cases.append(case)
+        cases.append(case)
 
     cases.sort(key=lambda c: c.id)
     return cases
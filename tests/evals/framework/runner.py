@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from docai.discovery.datatypes import FileClassification, FileManifest, ManifestEntry
 from docai.errors import DocaiError
 from docai.extractor.errors import ExtractionError
 from docai.extractor.llm_fallback import extract_with_llm
 from docai.llm.errors import LLMError
-from docai.llm.service import LLMService
 from tests.evals.framework.cases import EvalCase
 from tests.evals.framework.scorer import EvalResult, score
 
+if TYPE_CHECKING:
+    from docai.llm.service import LLMService
+
 PROJECT_ROOT: Path = Path(__file__).parent.parent.parent.parent
 
 _LANG_BY_EXT: dict[str, str] = {
@@ -61,29 +64,39 @@ async def run(
     *,
     concurrency: int = 10,
 ) -> list[EvalResult]:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
     if not cases:
         return []
 
     manifest = _build_manifest(cases)
-    sem = asyncio.Semaphore(concurrency)
 
     async def _run_one(case: EvalCase) -> EvalResult:
-        async with sem:
-            fixture_path = PROJECT_ROOT / case.fixture
-            content = fixture_path.read_text()
-            manifest_entry = manifest.get(case.fixture) or ManifestEntry(
-                classification=FileClassification.processed,
-                language=case.language,
-                content_hash=None,
-                override=None,
+        fixture_path = PROJECT_ROOT / case.fixture
+        content = fixture_path.read_text()
+        manifest_entry = manifest.get(case.fixture) or ManifestEntry(
+            classification=FileClassification.processed,
+            language=case.language,
+            content_hash=None,
+            override=None,
+        )
+        try:
+            analysis = await extract_with_llm(
+                case.fixture, content, manifest_entry, manifest, llm_service
             )
-            try:
-                analysis = await extract_with_llm(
-                    case.fixture, content, manifest_entry, manifest, llm_service
-                )
-                return score(case, analysis)
-            except (ExtractionError, LLMError) as exc:
-                return _error_result(case, exc)
-
-    results = await asyncio.gather(*(_run_one(c) for c in cases))
-    return list(results)
+            return score(case, analysis)
+        except (ExtractionError, LLMError) as exc:
+            return _error_result(case, exc)
+
+    # A fixed pool of workers pulls cases from a shared iterator, so at most
+    # `concurrency` coroutines exist at once instead of one per case.
+    indexed: list[tuple[int, EvalResult]] = []
+    pending = iter(enumerate(cases))
+
+    async def _worker() -> None:
+        for i, case in pending:
+            indexed.append((i, await _run_one(case)))
+
+    await asyncio.gather(*(_worker() for _ in range(min(concurrency, len(cases)))))
+    indexed.sort(key=lambda pair: pair[0])
+    return [result for _, result in indexed]
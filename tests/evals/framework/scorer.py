@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from docai.extractor.datatypes import Entity, FileAnalysis
-from tests.evals.framework.cases import CaseEntity, EvalCase
+from tests.evals.framework.cases import EvalCase
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     case: EvalCase
     file_type_match: bool
@@ -311,6 +311,17 @@ EXTENSION_ASSET_COMPILED_CASES: list[str] = [
 ]
 
 
+# ── fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def scratch_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # The table-driven cases only differ by file name or content and each writes
+    # its file before classifying it, so they share one directory, saving the
+    # mkdir of a fresh tmp_path per parametrized case.
+    return tmp_path_factory.mktemp("scratch")
+
+
 # ── tests ─────────────────────────────────────────────────────────────────────
 
 
@@ -345,11 +356,11 @@ class TestFilenameMap:
     @pytest.mark.parametrize("filename,expected_language", FILENAME_MAP_PROCESSED_CASES)
     def test_known_extensionless_processed_filename(
         self,
-        tmp_path: Path,
+        scratch_dir: Path,
         filename: str,
         expected_language: str,
     ) -> None:
-        path = tmp_path / filename
+        path = scratch_dir / filename
         path.write_bytes(b"# content")
         language, classification = classify(path)
         assert language == expected_language
@@ -357,9 +368,9 @@ class TestFilenameMap:
 
     @pytest.mark.parametrize("filename", FILENAME_MAP_IGNORED_CASES)
     def test_known_ignored_filename(
-        self, tmp_path: Path, filename: str
+        self, scratch_dir: Path, filename: str
     ) -> None:
-        path = tmp_path / filename
+        path = scratch_dir / filename
         path.write_bytes(b"# content")
         language, classification = classify(path)
         assert language is None
@@ -367,9 +378,9 @@ class TestFilenameMap:
 
     @pytest.mark.parametrize("filename", FILENAME_MAP_DOCUMENTATION_CASES)
     def test_known_documentation_filename(
-        self, tmp_path: Path, filename: str
+        self, scratch_dir: Path, filename: str
     ) -> None:
-        path = tmp_path / filename
+        path = scratch_dir / filename
         path.write_bytes(b"# content")
         language, classification = classify(path)
         assert language is None
@@ -391,11 +402,11 @@ class TestShebangDetection:
     @pytest.mark.parametrize("shebang_line,expected_language", SHEBANG_CASES)
     def test_shebang_classified_with_correct_language(
         self,
-        tmp_path: Path,
+        scratch_dir: Path,
         shebang_line: str,
         expected_language: str,
     ) -> None:
-        path = tmp_path / "script"
+        path = scratch_dir / "script"
         path.write_bytes(f"{shebang_line}\necho hello\n".encode())
         language, classification = classify(path)
         assert language == expected_language
@@ -426,11 +437,11 @@ class TestExtensionMapSource:
     @pytest.mark.parametrize("ext,expected_language", EXTENSION_SOURCE_CASES)
     def test_source_extension_classified_as_processed(
         self,
-        tmp_path: Path,
+        scratch_dir: Path,
         ext: str,
         expected_language: str,
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"# content")
         language, classification = classify(path)
         assert language == expected_language
@@ -441,9 +452,9 @@ class TestExtensionMapSource:
 class TestExtensionMapDocumentation:
     @pytest.mark.parametrize("ext", EXTENSION_DOCUMENTATION_CASES)
     def test_documentation_extension_classified_as_documentation(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"# content")
         language, classification = classify(path)
         assert language is None
@@ -454,9 +465,9 @@ class TestExtensionMapDocumentation:
 class TestExtensionMapIgnored:
     @pytest.mark.parametrize("ext", EXTENSION_IGNORED_CASES)
     def test_ignored_extension_classified_as_ignored(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"# content")
         language, classification = classify(path)
         assert language is None
@@ -467,9 +478,9 @@ class TestExtensionMapIgnored:
 class TestExtensionMapAssets:
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_IMAGE_CASES)
     def test_image_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -477,9 +488,9 @@ class TestExtensionMapAssets:
 
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_VIDEO_CASES)
     def test_video_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -487,9 +498,9 @@ class TestExtensionMapAssets:
 
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_AUDIO_CASES)
     def test_audio_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -497,9 +508,9 @@ class TestExtensionMapAssets:
 
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_FONT_CASES)
     def test_font_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -507,9 +518,9 @@ class TestExtensionMapAssets:
 
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_ARCHIVE_CASES)
     def test_archive_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -517,9 +528,9 @@ class TestExtensionMapAssets:
 
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_DOCUMENT_CASES)
     def test_document_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -527,9 +538,9 @@ class TestExtensionMapAssets:
 
     @pytest.mark.parametrize("ext", EXTENSION_ASSET_COMPILED_CASES)
     def test_compiled_extension_classified_as_asset(
-        self, tmp_path: Path, ext: str
+        self, scratch_dir: Path, ext: str
     ) -> None:
-        path = tmp_path / f"file{ext}"
+        path = scratch_dir / f"file{ext}"
         path.write_bytes(b"placeholder")
         language, classification = classify(path)
         assert language is None
@@ -361,6 +361,36 @@ class TestWalkSkippedFiles:
         )
 
 
+@pytest.mark.integration
+class TestWalkConcurrentScan:
+    def test_manifest_order_and_hashes_match_serial_walk(self, tmp_path: Path) -> None:
+        names = [f"mod_{i:02d}.py" for i in range(40)]
+        for name in reversed(names):
+            (tmp_path / name).write_text(f"# {name}\n")
+        walker = Walker(root=tmp_path, ignore_rules=IgnoreRules([]))
+        manifest, _, _ = walker.walk()
+        assert list(manifest) == names
+        for name in names:
+            expected = hashlib.sha256(f"# {name}\n".encode()).hexdigest()
+            assert manifest[name].content_hash == expected
+
+    def test_warnings_follow_entry_order(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        (tmp_path / "a_mystery").write_text("???")
+        (tmp_path / "b_link.py").symlink_to(tmp_path / "d_target.py")
+        (tmp_path / "c_mystery").write_text("???")
+        (tmp_path / "d_target.py").write_text("content")
+        walker = Walker(root=tmp_path, ignore_rules=IgnoreRules([]))
+        with caplog.at_level(logging.WARNING, logger="docai.discovery.walker"):
+            walker.walk()
+        assert [r.message for r in caplog.records] == [
+            "[Discovery] Unknown file type, skipping processing: 'a_mystery'",
+            "[Discovery] Symlink ignored: 'b_link.py'",
+            "[Discovery] Unknown file type, skipping processing: 'c_mystery'",
+        ]
+
+
 @pytest.mark.integration
 class TestWalkFileOverride:
     def test_excluded_file_has_override_exclude(self, tmp_path: Path) -> None:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
-from tests.evals.framework.cases import CaseEntity, EvalCase, load_cases
+from tests.evals.framework import cases as cases_module
+from tests.evals.framework.cases import CaseEntity, load_cases
 
 
 @pytest.fixture
@@ -161,6 +163,19 @@ class TestLoadCasesFiltering:
         result = load_cases("extractor", ids=None, cases_root=cases_root)
         assert len(result) == 2
 
+    @pytest.mark.unit
+    def test_unrequested_files_are_not_parsed(self, cases_root: Path) -> None:
+        for name in ["a", "b", "c"]:
+            _write_case(cases_root, f"extractor/source/python/{name}.yaml", {
+                "fixture": f"tests/fixtures/source/python/{name}.py",
+                "language": "python", "file_type": "source_file",
+                "expected_deps": [], "must_contain": [],
+            })
+        with patch.object(cases_module.yaml, "load", wraps=cases_module.yaml.load) as yaml_load:
+            result = load_cases("extractor", ids=["source__python__b"], cases_root=cases_root)
+        assert [c.id for c in result] == ["source__python__b"]
+        assert yaml_load.call_count == 1
+
 
 class TestLoadCasesErrorHandling:
     @pytest.mark.unit
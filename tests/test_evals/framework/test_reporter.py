@@ -5,8 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from docai.extractor.datatypes import Entity, EntityCategory, FileAnalysis, FileType
-from tests.evals.framework.cases import CaseEntity, EvalCase
+from tests.evals.framework.cases import EvalCase
 from tests.evals.framework.reporter import print_results, save_results
 from tests.evals.framework.scorer import EvalResult
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -158,6 +159,38 @@ class TestRunErrorHandling:
         assert ok_result.error is None
 
 
+class TestRunConcurrency:
+    @pytest.mark.llm
+    async def test_in_flight_extractions_bounded_by_concurrency(self, fixture_dir: Path) -> None:
+        cases = [
+            _make_case(fixture="tests/fixtures/source/python/simple.py", id=f"case_{i}")
+            for i in range(7)
+        ]
+        analysis = _make_analysis("tests/fixtures/source/python/simple.py")
+        in_flight = 0
+        peak = 0
+
+        async def slow_extract(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return analysis
+
+        with patch("tests.evals.framework.runner.extract_with_llm", new=slow_extract), \
+             patch("tests.evals.framework.runner.PROJECT_ROOT", fixture_dir):
+            results = await run(cases, llm_service=None, concurrency=3)  # type: ignore[arg-type]
+
+        assert peak == 3
+        assert [r.case.id for r in results] == [f"case_{i}" for i in range(7)]
+
+    @pytest.mark.llm
+    async def test_rejects_concurrency_below_one(self) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            await run([_make_case(fixture="tests/fixtures/source/python/simple.py")], llm_service=None, concurrency=0)  # type: ignore[arg-type]
+
+
 class TestRunManifest:
     @pytest.mark.llm
     async def test_manifest_includes_fixture_files(self, fixture_dir: Path) -> None:
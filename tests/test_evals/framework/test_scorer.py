@@ -4,7 +4,7 @@ import pytest
 
 from docai.extractor.datatypes import Entity, EntityCategory, FileAnalysis, FileType
 from tests.evals.framework.cases import CaseEntity, EvalCase
-from tests.evals.framework.scorer import EvalResult, score
+from tests.evals.framework.scorer import score
 
 
 def _make_case(**kwargs) -> EvalCase:
@@ -10,9 +10,7 @@ from docai.discovery.datatypes import FileClassification, FileManifest, Manifest
 from docai.extractor.datatypes import FileAnalysis, FileType
 from docai.extractor.errors import ExtractionError
 from docai.extractor.extractor import extract
-from docai.llm.errors import LLMError
 from docai.llm.service import LLMService
-from docai.state.errors import StateError
 
 
 @pytest.fixture
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from docai.discovery.datatypes import FileClassification, FileManifest, FileOverride, ManifestEntry
-from docai.extractor.datatypes import Entity, EntityCategory, FileAnalysis, FileType
+from docai.discovery.datatypes import FileClassification, FileManifest, ManifestEntry
+from docai.extractor import llm_fallback
+from docai.extractor.datatypes import Entity, EntityCategory, FileType
 from docai.extractor.errors import ExtractionError
 from docai.extractor.llm_fallback import EntityList, FileTypeAndDeps, extract_with_llm
 from docai.llm.errors import LLMError
@@ -247,3 +249,131 @@ class TestLLMFallbackErrors:
             )
 
         assert exc_info.value.__cause__ is original
+
+
+class TestLLMFallbackChunkedEntities:
+    @pytest.mark.llm
+    async def test_entity_prompt_loaded_once_for_all_chunks(
+        self,
+        llm_service: MagicMock,
+        processed_entry: ManifestEntry,
+    ) -> None:
+        llm_service.generate.return_value = EntityList(entities=[])
+        content = "\n".join(f"x{i} = {i}" for i in range(40))
+
+        with patch.object(
+            llm_fallback, "load_prompt", wraps=llm_fallback.load_prompt
+        ) as load_prompt:
+            await llm_fallback._extract_entities_chunked(
+                "src/foo.py",
+                content,
+                processed_entry,
+                llm_service,
+                chunk_size=10,
+                header_size=2,
+                overlap=2,
+            )
+
+        assert llm_service.generate.await_count > 1
+        assert load_prompt.call_count == 1
+        assert load_prompt.call_args.args == ("extractor/entities",)
+
+    @pytest.mark.llm
+    async def test_chunks_requested_concurrently(
+        self, llm_service: MagicMock, processed_entry: ManifestEntry
+    ) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def generate(*args, **kwargs) -> EntityList:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return EntityList(entities=[])
+
+        llm_service.generate.side_effect = generate
+        content = "\n".join(f"x{i} = {i}" for i in range(40))
+
+        await llm_fallback._extract_entities_chunked(
+            "src/foo.py",
+            content,
+            processed_entry,
+            llm_service,
+            chunk_size=10,
+            header_size=2,
+            overlap=2,
+        )
+
+        assert peak > 1
+
+    @pytest.mark.llm
+    async def test_failed_chunk_skipped_and_order_kept(
+        self, llm_service: MagicMock, processed_entry: ManifestEntry
+    ) -> None:
+        def entity(name: str) -> Entity:
+            return Entity(
+                category=EntityCategory.callable,
+                name=name,
+                kind="function",
+                parent=None,
+                signature=None,
+            )
+
+        llm_service.generate.side_effect = [
+            EntityList(entities=[entity("a")]),
+            LLMError(code="LLM_ALL_MODELS_FAILED", message="fail"),
+            EntityList(entities=[entity("c")]),
+        ]
+        content = "\n".join(f"x{i} = {i}" for i in range(20))
+
+        result = await llm_fallback._extract_entities_chunked(
+            "src/foo.py",
+            content,
+            processed_entry,
+            llm_service,
+            chunk_size=8,
+            header_size=2,
+            overlap=2,
+        )
+
+        assert llm_service.generate.await_count == 3
+        assert [e.name for e in result.entities] == ["a", "c"]
+
+    @pytest.mark.llm
+    async def test_unexpected_error_cancels_other_chunks(
+        self, llm_service: MagicMock, processed_entry: ManifestEntry
+    ) -> None:
+        started = 0
+        cancelled = 0
+
+        async def generate(*args, **kwargs) -> EntityList:
+            nonlocal started, cancelled
+            started += 1
+            if started == 1:
+                await asyncio.sleep(0)
+                raise ValueError("validator blew up")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return EntityList(entities=[])
+
+        llm_service.generate.side_effect = generate
+        content = "\n".join(f"x{i} = {i}" for i in range(20))
+
+        with pytest.raises(ValueError, match="validator blew up"):
+            await llm_fallback._extract_entities_chunked(
+                "src/foo.py",
+                content,
+                processed_entry,
+                llm_service,
+                chunk_size=8,
+                header_size=2,
+                overlap=2,
+            )
+
+        assert started == 3
+        assert cancelled == 2
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from docai.llm import admission as admission_module
+from docai.llm.admission import AdmissionController, TokenBucket
+from docai.llm.errors import LLMError
+
+
+async def _hold(admission: AdmissionController, entered: list[int], gate: asyncio.Event) -> None:
+    async with admission:
+        entered.append(admission.in_flight)
+        await gate.wait()
+
+
+# ── construction ──────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestConstruction:
+    def test_starts_with_full_capacity(self) -> None:
+        admission = AdmissionController(3)
+        assert admission.limit == 3
+        assert admission.in_flight == 0
+        assert admission.available == 3
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_non_positive_limit_raises(self, limit: int) -> None:
+        with pytest.raises(LLMError) as exc_info:
+            AdmissionController(limit)
+        assert exc_info.value.code == "LLM_INVALID_CONCURRENCY"
+
+
+# ── acquire / release ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestAcquireRelease:
+    async def test_context_manager_releases_slot(self) -> None:
+        admission = AdmissionController(2)
+        async with admission:
+            assert admission.available == 1
+        assert admission.available == 2
+
+    async def test_slot_released_when_body_raises(self) -> None:
+        admission = AdmissionController(1)
+        with pytest.raises(RuntimeError):
+            async with admission:
+                raise RuntimeError("boom")
+        assert admission.in_flight == 0
+
+    async def test_never_admits_more_than_limit(self) -> None:
+        admission = AdmissionController(2)
+        entered: list[int] = []
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(admission, entered, gate)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert admission.in_flight == 2
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert len(entered) == 5
+        assert max(entered) <= 2
+        assert admission.in_flight == 0
+
+
+# ── set_limit ─────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestSetLimit:
+    async def test_raising_limit_admits_waiters(self) -> None:
+        admission = AdmissionController(1)
+        entered: list[int] = []
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(admission, entered, gate)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert admission.in_flight == 1
+        await admission.set_limit(3)
+        await asyncio.sleep(0)
+        assert admission.in_flight == 3
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    async def test_lowering_limit_keeps_held_slots(self) -> None:
+        admission = AdmissionController(3)
+        entered: list[int] = []
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(admission, entered, gate)) for _ in range(3)]
+        await asyncio.sleep(0)
+        await admission.set_limit(1)
+        assert admission.in_flight == 3
+        assert admission.available == 0
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert admission.in_flight == 0
+        assert admission.available == 1
+
+    async def test_non_positive_limit_raises(self) -> None:
+        admission = AdmissionController(2)
+        with pytest.raises(LLMError) as exc_info:
+            await admission.set_limit(0)
+        assert exc_info.value.code == "LLM_INVALID_CONCURRENCY"
+        assert admission.limit == 2
+
+
+# ── TokenBucket ───────────────────────────────────────────────────────────────
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake = _FakeClock()
+    monkeypatch.setattr(admission_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(admission_module.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    async def test_burst_admitted_without_waiting(self, clock: _FakeClock) -> None:
+        bucket = TokenBucket(rate=1, burst=3)
+        for _ in range(3):
+            await bucket.acquire()
+        assert clock.sleeps == []
+
+    async def test_waits_for_refill_once_empty(self, clock: _FakeClock) -> None:
+        bucket = TokenBucket(rate=2, burst=1)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    async def test_cost_consumes_multiple_tokens(self, clock: _FakeClock) -> None:
+        bucket = TokenBucket(rate=10, burst=100)
+        await bucket.acquire(80)
+        await bucket.acquire(50)
+        assert clock.sleeps == [pytest.approx(3.0)]
+
+    async def test_cost_above_burst_waits_for_full_bucket(self, clock: _FakeClock) -> None:
+        bucket = TokenBucket(rate=10, burst=100)
+        await bucket.acquire(100)
+        await bucket.acquire(500)
+        assert clock.sleeps == [pytest.approx(10.0)]
+
+    async def test_refill_capped_at_burst(self, clock: _FakeClock) -> None:
+        bucket = TokenBucket(rate=1, burst=2)
+        clock.now = 1000.0
+        for _ in range(3):
+            await bucket.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    @pytest.mark.parametrize(("rate", "burst"), [(0, 1), (1, 0), (-1, 1)])
+    def test_non_positive_values_raise(self, rate: float, burst: float) -> None:
+        with pytest.raises(LLMError) as exc_info:
+            TokenBucket(rate=rate, burst=burst)
+        assert exc_info.value.code == "LLM_INVALID_RATE_LIMIT"
@@ -15,6 +15,11 @@ class TestModelConfigConstruction:
         assert config.validation_retries == 3
         assert config.max_concurrency == 5
         assert config.extra_kwargs == {}
+        assert config.transient_retries == 0
+        assert config.retry_base_delay == 1.0
+        assert config.retry_max_delay == 30.0
+        assert config.requests_per_minute is None
+        assert config.tokens_per_minute is None
 
     def test_all_fields_accessible(self) -> None:
         config = ModelConfig(
@@ -64,6 +69,11 @@ class TestModelConfigFieldValidation:
             ("num_retries", 0),
             ("validation_retries", 0),
             ("max_concurrency", 0),
+            ("transient_retries", -1),
+            ("retry_base_delay", -0.1),
+            ("retry_max_delay", -0.1),
+            ("requests_per_minute", 0),
+            ("tokens_per_minute", 0),
             ("n", 0),
             ("max_completion_tokens", 0),
             ("max_tokens", 0),
@@ -90,6 +100,11 @@ class TestModelConfigFieldValidation:
             ("num_retries", 1),
             ("validation_retries", 1),
             ("max_concurrency", 1),
+            ("transient_retries", 0),
+            ("retry_base_delay", 0.0),
+            ("retry_max_delay", 0.0),
+            ("requests_per_minute", 1),
+            ("tokens_per_minute", 1),
             ("n", 1),
             ("max_completion_tokens", 1),
             ("max_tokens", 1),
@@ -174,6 +189,26 @@ class TestToLitellmKwargs:
         config = ModelConfig(model="gemini/gemini-2.0-flash", max_concurrency=20)
         assert "max_concurrency" not in config.to_litellm_kwargs()
 
+    def test_transient_retry_settings_not_in_output(self) -> None:
+        config = ModelConfig(
+            model="gemini/gemini-2.0-flash",
+            transient_retries=2,
+            retry_base_delay=0.5,
+            retry_max_delay=10.0,
+        )
+        result = config.to_litellm_kwargs()
+        assert "transient_retries" not in result
+        assert "retry_base_delay" not in result
+        assert "retry_max_delay" not in result
+
+    def test_rate_limits_not_in_output(self) -> None:
+        config = ModelConfig(
+            model="gemini/gemini-2.0-flash", requests_per_minute=60, tokens_per_minute=1000
+        )
+        result = config.to_litellm_kwargs()
+        assert "requests_per_minute" not in result
+        assert "tokens_per_minute" not in result
+
     def test_extra_kwargs_flattened_to_top_level(self) -> None:
         config = ModelConfig(
             model="gemini/gemini-2.0-flash",
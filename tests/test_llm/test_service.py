@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import litellm
 import openai
 import pytest
 from pydantic import BaseModel
 
-from docai.llm.datatypes import LLMProfile, LLMStats, LogConfig, ModelConfig, ModelStats
+from docai.llm import service as service_module
+from docai.llm.datatypes import LLMProfile, LogConfig, ModelConfig
 from docai.llm.errors import LLMError
-from docai.llm.service import LLMService
+from docai.llm.service import LLMService, aclose_llm_clients
 
 # All params a well-supported model exposes
 ALL_SUPPORTED_PARAMS = [
@@ -37,6 +38,11 @@ ALL_SUPPORTED_PARAMS = [
 # ── fixtures ──────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def _fresh_key_validation_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("docai.llm.service._VALIDATED_KEYS", set())
+
+
 @pytest.fixture
 def log_dir(tmp_path: Path) -> Path:
     d = tmp_path / "logs"
@@ -89,7 +95,7 @@ class TestConstruction:
         service = LLMService(profile=profile, log_config=log_config)
         assert len(service._connections) == 2
 
-    def test_global_semaphore_uses_profile_max_concurrency(
+    def test_global_admission_uses_profile_max_concurrency(
         self, litellm_ok, log_config: LogConfig
     ) -> None:
         profile = LLMProfile(
@@ -97,9 +103,9 @@ class TestConstruction:
             max_concurrency=7,
         )
         service = LLMService(profile=profile, log_config=log_config)
-        assert service._global_semaphore._value == 7
+        assert service._global_admission.limit == 7
 
-    def test_per_model_semaphore_uses_model_concurrency_when_below_profile_limit(
+    def test_per_model_admission_uses_model_concurrency_when_below_profile_limit(
         self, litellm_ok, log_config: LogConfig
     ) -> None:
         profile = LLMProfile(
@@ -107,10 +113,10 @@ class TestConstruction:
             max_concurrency=10,
         )
         service = LLMService(profile=profile, log_config=log_config)
-        _, _, semaphore = service._connections[0]
-        assert semaphore._value == 3
+        admission = service._connections[0].admission
+        assert admission.limit == 3
 
-    def test_per_model_semaphore_capped_at_profile_max_concurrency(
+    def test_per_model_admission_capped_at_profile_max_concurrency(
         self, litellm_ok, log_config: LogConfig
     ) -> None:
         profile = LLMProfile(
@@ -118,8 +124,8 @@ class TestConstruction:
             max_concurrency=5,
         )
         service = LLMService(profile=profile, log_config=log_config)
-        _, _, semaphore = service._connections[0]
-        assert semaphore._value == 5
+        admission = service._connections[0].admission
+        assert admission.limit == 5
 
     def test_capping_logs_debug_message(
         self,
@@ -276,6 +282,57 @@ class TestApiKeyValidation:
                 )
         assert exc_info.value.code == "LLM_AUTH_FAILED"
 
+    def test_valid_key_checked_once_across_services(self, log_config: LogConfig) -> None:
+        profile = LLMProfile(
+            models=[ModelConfig(model="gemini/gemini-2.0-flash", api_key="key-a")]
+        )
+        with (
+            patch("litellm.check_valid_key") as mock_key,
+            patch("litellm.get_supported_openai_params") as mock_params,
+            patch("litellm.supports_response_schema") as mock_schema,
+        ):
+            mock_key.return_value = True
+            mock_params.return_value = list(ALL_SUPPORTED_PARAMS)
+            mock_schema.return_value = True
+            LLMService(profile=profile, log_config=log_config)
+            LLMService(profile=profile, log_config=log_config)
+        assert mock_key.call_count == 1
+
+    def test_invalid_key_rechecked_on_next_service(self, log_config: LogConfig) -> None:
+        profile = LLMProfile(
+            models=[ModelConfig(model="gemini/gemini-2.0-flash", api_key="bad-key")]
+        )
+        with (
+            patch("litellm.check_valid_key") as mock_key,
+            patch("litellm.get_supported_openai_params") as mock_params,
+        ):
+            mock_key.return_value = False
+            mock_params.return_value = list(ALL_SUPPORTED_PARAMS)
+            for _ in range(2):
+                with pytest.raises(LLMError):
+                    LLMService(profile=profile, log_config=log_config)
+        assert mock_key.call_count == 2
+
+    def test_validation_cache_does_not_store_plaintext_key(
+        self, log_config: LogConfig
+    ) -> None:
+        with (
+            patch("litellm.check_valid_key") as mock_key,
+            patch("litellm.get_supported_openai_params") as mock_params,
+            patch("litellm.supports_response_schema") as mock_schema,
+        ):
+            mock_key.return_value = True
+            mock_params.return_value = list(ALL_SUPPORTED_PARAMS)
+            mock_schema.return_value = True
+            LLMService(
+                profile=LLMProfile(
+                    models=[ModelConfig(model="gemini/gemini-2.0-flash", api_key="secret-key-123")]
+                ),
+                log_config=log_config,
+            )
+        assert all("secret-key-123" not in entry for entry in service_module._VALIDATED_KEYS)
+        assert len(service_module._VALIDATED_KEYS) == 1
+
 
 # ── capability checks ─────────────────────────────────────────────────────────
 
@@ -378,6 +435,30 @@ class TestUnsupportedParameterCheck:
             "Model 'gemini/gemini-2.0-flash' does not support parameter 'temperature'"
         )
 
+    def test_first_unsupported_parameter_reported_alphabetically(
+        self, log_config: LogConfig
+    ) -> None:
+        params = [p for p in ALL_SUPPORTED_PARAMS if p not in ("top_p", "temperature", "n")]
+        with patch("litellm.get_supported_openai_params") as mock_params:
+            mock_params.return_value = params
+            with pytest.raises(LLMError) as exc_info:
+                LLMService(
+                    profile=LLMProfile(
+                        models=[
+                            ModelConfig(
+                                model="gemini/gemini-2.0-flash",
+                                top_p=0.5,
+                                temperature=0.7,
+                                n=1,
+                            )
+                        ]
+                    ),
+                    log_config=log_config,
+                )
+        assert exc_info.value.message == (
+            "Model 'gemini/gemini-2.0-flash' does not support parameter 'n'"
+        )
+
 
 # ── log dir setup ─────────────────────────────────────────────────────────────
 
@@ -546,11 +627,12 @@ class TestCall:
     async def test_messages_forwarded_to_acompletion(
         self, generate_service: LLMService
     ) -> None:
-        model_args, _, semaphore = generate_service._connections[0]
+        conn = generate_service._connections[0]
+        model_args, admission = conn.model_args, conn.admission
         messages = [{"role": "user", "content": "hello"}]
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.return_value = _make_llm_response()
-            await generate_service._call(model_args, messages, semaphore)
+            await generate_service._call(model_args, messages, admission)
         assert mock_ac.call_args.kwargs["messages"] == messages
 
     @pytest.mark.parametrize(
@@ -574,23 +656,25 @@ class TestCall:
     async def test_openai_error_returned_not_raised(
         self, generate_service: LLMService, exc: openai.OpenAIError
     ) -> None:
-        model_args, _, semaphore = generate_service._connections[0]
+        conn = generate_service._connections[0]
+        model_args, admission = conn.model_args, conn.admission
         messages = [{"role": "user", "content": "hello"}]
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.side_effect = exc
-            result, usage = await generate_service._call(model_args, messages, semaphore)
+            result, usage = await generate_service._call(model_args, messages, admission)
         assert result is exc
         assert usage is None
 
     async def test_non_openai_exception_propagates(
         self, generate_service: LLMService
     ) -> None:
-        model_args, _, semaphore = generate_service._connections[0]
+        conn = generate_service._connections[0]
+        model_args, admission = conn.model_args, conn.admission
         messages = [{"role": "user", "content": "hello"}]
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.side_effect = ValueError("unexpected error")
             with pytest.raises(ValueError, match="unexpected error"):
-                await generate_service._call(model_args, messages, semaphore)
+                await generate_service._call(model_args, messages, admission)
 
 
 # ── generate() — happy path ───────────────────────────────────────────────────
@@ -633,7 +717,7 @@ class TestGenerateHappyPath:
     async def test_connection_kwargs_forwarded_to_acompletion(
         self, generate_service: LLMService
     ) -> None:
-        expected_kwargs = generate_service._connections[0][0]
+        expected_kwargs = generate_service._connections[0].model_args
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.return_value = _make_llm_response()
             await generate_service.generate(prompt="test")
@@ -806,6 +890,194 @@ class TestGenerateFallback:
         assert exc_info.value.message == "All models failed to produce a valid response"
 
 
+# ── generate() — transient error backoff ─────────────────────────────────────
+
+
+def _rate_limit_error(retry_after: str | None = None) -> litellm.RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    request = httpx.Request("POST", "https://example.invalid")
+    return litellm.RateLimitError(
+        message="rate limited",
+        llm_provider="gemini",
+        model="gemini-2.0-flash",
+        response=httpx.Response(429, headers=headers, request=request),
+    )
+
+
+@pytest.fixture
+def retrying_service(litellm_ok, log_config: LogConfig) -> LLMService:
+    profile = LLMProfile(
+        models=[
+            ModelConfig(
+                model="gemini/gemini-2.0-flash",
+                transient_retries=2,
+                retry_base_delay=0.5,
+                retry_max_delay=4.0,
+            ),
+            ModelConfig(model="gemini/gemini-2.0-pro"),
+        ],
+    )
+    return LLMService(profile=profile, log_config=log_config)
+
+
+@pytest.mark.llm
+class TestGenerateTransientBackoff:
+    async def test_transient_error_retried_on_same_model(
+        self, retrying_service: LLMService
+    ) -> None:
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_ac.side_effect = [_rate_limit_error(), _make_llm_response("recovered")]
+            result = await retrying_service.generate(prompt="test")
+
+        assert result == "recovered"
+        assert [c.kwargs["model"] for c in mock_ac.call_args_list] == [
+            "gemini/gemini-2.0-flash",
+            "gemini/gemini-2.0-flash",
+        ]
+        mock_sleep.assert_awaited_once()
+
+    async def test_falls_back_after_transient_retries_exhausted(
+        self, retrying_service: LLMService
+    ) -> None:
+        async def fake_acompletion(**kwargs):
+            if kwargs.get("model") == "gemini/gemini-2.0-flash":
+                raise _rate_limit_error()
+            return _make_llm_response("second model response")
+
+        with (
+            patch("litellm.acompletion", side_effect=fake_acompletion) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await retrying_service.generate(prompt="test")
+
+        assert result == "second model response"
+        assert mock_ac.call_count == 4  # 1 + 2 transient retries, then fallback
+        assert mock_sleep.await_count == 2
+
+    async def test_non_transient_error_not_retried(
+        self, retrying_service: LLMService
+    ) -> None:
+        async def fake_acompletion(**kwargs):
+            if kwargs.get("model") == "gemini/gemini-2.0-flash":
+                raise openai.OpenAIError("bad request")
+            return _make_llm_response("second model response")
+
+        with (
+            patch("litellm.acompletion", side_effect=fake_acompletion) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            await retrying_service.generate(prompt="test")
+
+        assert mock_ac.call_count == 2
+        mock_sleep.assert_not_awaited()
+
+    async def test_backoff_delays_grow_and_respect_cap(
+        self, retrying_service: LLMService
+    ) -> None:
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_ac.side_effect = _rate_limit_error()
+            with pytest.raises(LLMError):
+                await retrying_service.generate(prompt="test")
+
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        assert len(delays) == 2
+        assert 0.25 <= delays[0] <= 0.75  # 0.5s base, ±50% jitter
+        assert 0.5 <= delays[1] <= 1.5
+        assert all(d <= 4.0 for d in delays)
+
+    async def test_retry_after_seconds_preferred_over_backoff(
+        self, retrying_service: LLMService
+    ) -> None:
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_ac.side_effect = [_rate_limit_error(retry_after="2"), _make_llm_response()]
+            await retrying_service.generate(prompt="test")
+
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    async def test_retry_after_capped_at_max_delay(
+        self, retrying_service: LLMService
+    ) -> None:
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_ac.side_effect = [_rate_limit_error(retry_after="120"), _make_llm_response()]
+            await retrying_service.generate(prompt="test")
+
+        mock_sleep.assert_awaited_once_with(4.0)
+
+    async def test_retry_after_http_date_supported(
+        self, retrying_service: LLMService
+    ) -> None:
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=3)
+        header = retry_at.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_ac.side_effect = [_rate_limit_error(retry_after=header), _make_llm_response()]
+            await retrying_service.generate(prompt="test")
+
+        (delay,) = mock_sleep.await_args.args
+        assert 0.0 <= delay <= 3.0
+
+    async def test_unparseable_retry_after_falls_back_to_backoff(
+        self, retrying_service: LLMService
+    ) -> None:
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_ac.side_effect = [_rate_limit_error(retry_after="soon"), _make_llm_response()]
+            await retrying_service.generate(prompt="test")
+
+        (delay,) = mock_sleep.await_args.args
+        assert 0.25 <= delay <= 0.75
+
+    async def test_admission_slots_free_while_backing_off(
+        self, retrying_service: LLMService
+    ) -> None:
+        observed: list[int] = []
+        conn = retrying_service._connections[0]
+
+        async def fake_sleep(delay: float) -> None:
+            observed.append(conn.admission.in_flight)
+            observed.append(retrying_service._global_admission.in_flight)
+
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            mock_ac.side_effect = [_rate_limit_error(), _make_llm_response()]
+            await retrying_service.generate(prompt="test")
+
+        assert observed == [0, 0]
+
+    async def test_failed_transient_attempts_are_logged(
+        self, retrying_service: LLMService, log_dir: Path
+    ) -> None:
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+            patch("docai.llm.service.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_ac.side_effect = [_rate_limit_error(), _make_llm_response()]
+            await retrying_service.generate(prompt="test")
+
+        entry = json.loads((log_dir / "llm.log").read_text().strip())
+        assert len(entry["attempts"]) == 2
+        assert entry["attempts"][0]["error"] is not None
+        assert entry["attempts"][1]["error"] is None
+
+
 # ── generate() — structured output parsing ───────────────────────────────────
 
 
@@ -825,42 +1097,128 @@ class TestGenerateStructuredOutputParsing:
         assert exc_info.value.code == "LLM_ALL_MODELS_FAILED"
 
 
-# ── generate() — semaphores ───────────────────────────────────────────────────
+# ── generate() — admission ────────────────────────────────────────────────────
 
 
 @pytest.mark.llm
-class TestGenerateSemaphores:
-    async def test_global_semaphore_restored_after_successful_call(
+class TestGenerateAdmission:
+    async def test_global_slot_released_after_successful_call(
         self, generate_service: LLMService
     ) -> None:
-        initial = generate_service._global_semaphore._value
+        initial = generate_service._global_admission.available
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.return_value = _make_llm_response()
             await generate_service.generate(prompt="test")
-        assert generate_service._global_semaphore._value == initial
+        assert generate_service._global_admission.available == initial
 
-    async def test_per_model_semaphore_restored_after_successful_call(
+    async def test_per_model_slot_released_after_successful_call(
         self, generate_service: LLMService
     ) -> None:
-        _, _, semaphore = generate_service._connections[0]
-        initial = semaphore._value
+        admission = generate_service._connections[0].admission
+        initial = admission.available
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.return_value = _make_llm_response()
             await generate_service.generate(prompt="test")
-        assert semaphore._value == initial
+        assert admission.available == initial
 
-    async def test_semaphores_restored_after_acompletion_raises(
+    async def test_slots_released_after_acompletion_raises(
         self, generate_service: LLMService
     ) -> None:
-        global_initial = generate_service._global_semaphore._value
-        _, _, semaphore = generate_service._connections[0]
-        model_initial = semaphore._value
+        global_initial = generate_service._global_admission.available
+        admission = generate_service._connections[0].admission
+        model_initial = admission.available
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
             mock_ac.side_effect = openai.OpenAIError("API error")
             with pytest.raises(LLMError):
                 await generate_service.generate(prompt="test")
-        assert generate_service._global_semaphore._value == global_initial
-        assert semaphore._value == model_initial
+        assert generate_service._global_admission.available == global_initial
+        assert admission.available == model_initial
+
+
+@pytest.mark.llm
+class TestSetMaxConcurrency:
+    async def test_resizes_global_limit(self, generate_service: LLMService) -> None:
+        await generate_service.set_max_concurrency(3)
+        assert generate_service._global_admission.limit == 3
+
+    async def test_model_limits_recapped_against_new_value(
+        self, litellm_ok, log_config: LogConfig
+    ) -> None:
+        service = LLMService(
+            profile=LLMProfile(
+                models=[
+                    ModelConfig(model="gemini/gemini-2.0-flash", max_concurrency=8),
+                    ModelConfig(model="gemini/gemini-2.0-pro", max_concurrency=2),
+                ],
+                max_concurrency=4,
+            ),
+            log_config=log_config,
+        )
+        await service.set_max_concurrency(6)
+        assert [c.admission.limit for c in service._connections] == [6, 2]
+        await service.set_max_concurrency(1)
+        assert [c.admission.limit for c in service._connections] == [1, 1]
+
+    async def test_invalid_value_leaves_limits_unchanged(
+        self, generate_service: LLMService
+    ) -> None:
+        before = generate_service._global_admission.limit
+        with pytest.raises(LLMError) as exc_info:
+            await generate_service.set_max_concurrency(0)
+        assert exc_info.value.code == "LLM_INVALID_CONCURRENCY"
+        assert generate_service._global_admission.limit == before
+
+
+# ── generate() — rate limits ─────────────────────────────────────────────────
+
+
+@pytest.mark.llm
+class TestGenerateRateLimits:
+    def test_no_buckets_by_default(self, generate_service: LLMService) -> None:
+        conn = generate_service._connections[0]
+        assert conn.request_bucket is None
+        assert conn.token_bucket is None
+
+    async def test_buckets_charged_before_each_call(
+        self, litellm_ok, log_config: LogConfig
+    ) -> None:
+        service = LLMService(
+            profile=LLMProfile(
+                models=[
+                    ModelConfig(
+                        model="gemini/gemini-2.0-flash",
+                        requests_per_minute=60,
+                        tokens_per_minute=6000,
+                    )
+                ],
+            ),
+            log_config=log_config,
+        )
+        conn = service._connections[0]
+        with (
+            patch.object(conn.request_bucket, "acquire", new_callable=AsyncMock) as req,
+            patch.object(conn.token_bucket, "acquire", new_callable=AsyncMock) as tok,
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac,
+        ):
+            mock_ac.return_value = _make_llm_response()
+            await service.generate(prompt="x" * 400)
+        req.assert_awaited_once_with()
+        tok.assert_awaited_once_with(100)
+
+
+# ── aclose_llm_clients() ──────────────────────────────────────────────────────
+
+
+@pytest.mark.llm
+class TestClose:
+    async def test_closes_and_flushes_litellm_clients(self) -> None:
+        with (
+            patch("litellm.close_litellm_async_clients", new_callable=AsyncMock) as close,
+            patch.object(litellm.in_memory_llm_clients_cache, "flush_cache") as flush,
+        ):
+            await aclose_llm_clients()
+        close.assert_awaited_once()
+        flush.assert_called_once()
 
 
 # ── generate() — logging ─────────────────────────────────────────────────────
@@ -948,6 +1306,23 @@ class TestGenerateLogging:
         entry = json.loads((log_dir / "llm.log").read_text().strip())
         assert entry["attempts"][0]["model_args"]["api_key"] == "[REDACTED]"
 
+    async def test_api_key_still_sent_to_acompletion(
+        self, litellm_ok, log_config: LogConfig
+    ) -> None:
+        service = LLMService(
+            profile=LLMProfile(
+                models=[ModelConfig(model="gemini/gemini-2.0-flash", api_key="secret-key-123")],
+                skip_api_key_validation=True,
+            ),
+            log_config=log_config,
+        )
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_ac:
+            mock_ac.return_value = _make_llm_response()
+            await service.generate(prompt="test")
+            await service.generate(prompt="test")
+
+        assert all(c.kwargs["api_key"] == "secret-key-123" for c in mock_ac.call_args_list)
+
 
 # ── _log() ────────────────────────────────────────────────────────────────────
 
@@ -1039,7 +1414,7 @@ class TestLog:
         self, log_service: LLMService, log_dir: Path
     ) -> None:
         attempt = log_service._log_attempt(
-            model_args=log_service._connections[0][0],
+            model_args=log_service._connections[0].log_model_args,
             latency=0.05,
             messages=[{"role": "user", "content": "hi"}],
         )
@@ -1047,6 +1422,14 @@ class TestLog:
         entry = json.loads((log_dir / "llm.log").read_text().strip())
         assert len(entry["attempts"]) == 1
 
+    def test_plaintext_api_key_redacted_in_attempt(self, log_service: LLMService) -> None:
+        attempt = log_service._log_attempt(
+            model_args={"model": "gemini/gemini-2.0-flash", "api_key": "secret-key-123"},
+            latency=0.05,
+            messages=[{"role": "user", "content": "hi"}],
+        )
+        assert attempt.model_args["api_key"] == "[REDACTED]"
+
     async def test_two_calls_append_two_lines(
         self, log_service: LLMService, log_dir: Path
     ) -> None:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from docai.prompts import loader
 from docai.prompts.errors import PromptNotFoundError
 from docai.prompts.loader import PromptTemplate, load_prompt
 
@@ -106,6 +109,15 @@ class TestHappyPath:
         assert result.system_prompt_template == _BASE_SYSTEM
         assert result.user_prompt_template == _BASE_USER
 
+    def test_prompt_template_is_immutable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("docai.prompts.loader.PROMPTS_ROOT", tmp_path)
+        _write_base(tmp_path)
+        result = load_prompt("extractor")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.system_prompt_template = "mutated"  # type: ignore[misc]
+
 
 # ── error cases ───────────────────────────────────────────────────────────────
 
@@ -173,3 +185,31 @@ class TestEdgeCases:
         assert result.system_prompt_template == "first"
         assert result.user_prompt_template == "first user"
         assert len([r for r in caplog.records if r.levelno == logging.WARNING]) == 1
+
+
+# ── parse cache ───────────────────────────────────────────────────────────────
+
+
+@pytest.mark.integration
+class TestParseCache:
+    def test_repeated_load_parses_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("docai.prompts.loader.PROMPTS_ROOT", tmp_path)
+        _write_base(tmp_path)
+        with patch.object(loader.yaml, "load", wraps=loader.yaml.load) as yaml_load:
+            load_prompt("extractor")
+            load_prompt("extractor")
+        assert yaml_load.call_count == 1
+
+    def test_modified_file_is_reparsed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("docai.prompts.loader.PROMPTS_ROOT", tmp_path)
+        _write_base(tmp_path)
+        assert load_prompt("extractor").system_prompt_template == _BASE_SYSTEM
+        (tmp_path / "extractor" / "base.yaml").write_text(
+            "system_prompt_template: 'changed on disk'\n"
+            f"user_prompt_template: {_BASE_USER!r}\n"
+        )
+        assert load_prompt("extractor").system_prompt_template == "changed on disk"
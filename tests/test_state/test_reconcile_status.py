@@ -6,7 +6,6 @@ from pathlib import Path
 import pytest
 
 from docai.discovery.datatypes import (
-    AssetSummary,
     DirectoryEntry,
     FileClassification,
     ManifestEntry,